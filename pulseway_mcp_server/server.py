@@ -6,8 +6,11 @@ allowing Claude to manage tickets, invoices, opportunities, time logs, and more.
 """
 
 import os
+import re
+import time
 import asyncio
-from typing import Any, Optional
+from collections import OrderedDict, deque
+from typing import Any, Callable, Optional
 from dotenv import load_dotenv
 import httpx
 from mcp.server import Server
@@ -23,8 +26,151 @@ import mcp.server.stdio
 load_dotenv("secrets.env")
 
 
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because its circuit is open"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(
+            f"Pulseway API circuit open for {endpoint}; "
+            f"retry in {retry_after:.0f}s"
+        )
+
+
+class StaleResult:
+    """Last known good response served while the API is unavailable"""
+
+    def __init__(self, data: Any, age_seconds: float):
+        self.data = data
+        self.age_seconds = age_seconds
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker with closed, open and half-open states"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float = 10.0,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        window_seconds: float = 300.0,
+        minimum_calls: int = 5,
+        open_seconds: float = 30.0,
+        half_open_trials: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_seconds = window_seconds
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_trials = half_open_trials
+        self.clock = clock
+        self.state = self.CLOSED
+        # Bumped on every state change so late results can be told apart
+        self.generation = 0
+        self.opened_at = 0.0
+        self.trials_in_flight = 0
+        # (finished_at, failed, slow) outcome of each recent call
+        self.calls: deque[tuple[float, bool, bool]] = deque(maxlen=window_size)
+
+    def retry_after(self) -> float:
+        """Seconds until a rejected request is worth retrying.
+
+        While half-open, this is the slow-call threshold, by which time the
+        in-flight trial should have settled the circuit one way or the other.
+        """
+        if self.state == self.HALF_OPEN:
+            return self.slow_call_threshold
+        return max(0.0, self.opened_at + self.open_seconds - self.clock())
+
+    def allow_request(self) -> Optional[int]:
+        """Check whether a request may be sent.
+
+        Returns a permit (the current generation) to pass to record() or
+        release(), or None if the request is rejected. In the half-open
+        state a permit also reserves one of the trial slots.
+        """
+        if self.state == self.OPEN:
+            if self.retry_after() > 0:
+                return None
+            self._transition(self.HALF_OPEN)
+
+        if self.state == self.HALF_OPEN:
+            if self.trials_in_flight >= self.half_open_trials:
+                return None
+            self.trials_in_flight += 1
+
+        return self.generation
+
+    def release(self, permit: int) -> None:
+        """Give back a trial slot for a request that ended without an outcome"""
+        if permit == self.generation and self.state == self.HALF_OPEN:
+            self.trials_in_flight = max(0, self.trials_in_flight - 1)
+
+    def record(self, permit: int, failed: bool, elapsed: float) -> None:
+        """Record the outcome of a request and update the circuit state.
+
+        Results from requests admitted before the last state change are
+        ignored, so requests still in flight when the circuit opened cannot
+        re-open it or be mistaken for half-open trials.
+        """
+        if permit != self.generation or self.state == self.OPEN:
+            return
+
+        slow = elapsed >= self.slow_call_threshold
+
+        if self.state == self.HALF_OPEN:
+            self.trials_in_flight = max(0, self.trials_in_flight - 1)
+            if failed or slow:
+                self._open()
+            else:
+                self._transition(self.CLOSED)
+            return
+
+        now = self.clock()
+        self.calls.append((now, failed, slow))
+        # Sporadic errors from long ago say nothing about the gateway now
+        while self.calls[0][0] < now - self.window_seconds:
+            self.calls.popleft()
+        if len(self.calls) < self.minimum_calls:
+            return
+
+        total = len(self.calls)
+        failure_rate = sum(1 for _, f, _ in self.calls if f) / total
+        slow_rate = sum(1 for _, _, s in self.calls if s) / total
+        if (
+            failure_rate >= self.failure_rate_threshold
+            or slow_rate >= self.slow_call_rate_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._transition(self.OPEN)
+        self.opened_at = self.clock()
+
+    def _transition(self, state: str) -> None:
+        self.state = state
+        self.generation += 1
+        self.trials_in_flight = 0
+        self.calls.clear()
+
+
 class PulsewayClient:
-    """Client for interacting with Pulseway PSA API"""
+    """Client for interacting with Pulseway PSA API
+
+    Read methods may return a StaleResult instead of the response JSON when
+    the API is unavailable; see _request.
+    """
+
+    STALE_CACHE_SIZE = 256
 
     def __init__(
         self,
@@ -32,6 +178,7 @@ class PulsewayClient:
         username: str,
         password: str,
         company_name: str,
+        breaker_options: Optional[dict[str, Any]] = None,
     ):
         self.gateway_url = gateway_url.rstrip("/")
         self.username = username
@@ -39,6 +186,29 @@ class PulsewayClient:
         self.company_name = company_name
         self.base_url = f"{self.gateway_url}/api/v2"
         self.client = httpx.AsyncClient(timeout=30.0)
+        self.breaker_options = breaker_options or {}
+        self.breakers: dict[str, CircuitBreaker] = {}
+        # Last known good GET responses: key -> (monotonic timestamp, data)
+        self.stale_cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def _breaker_for(self, endpoint: str) -> tuple[str, CircuitBreaker]:
+        """Get the circuit breaker for an endpoint, grouping numeric IDs.
+
+        Reads and writes to the same route share a breaker, so an outage
+        seen by reads also makes writes fail fast.
+        """
+        key = re.sub(r"/\d+(?=/|$)", "/{id}", endpoint)
+        if key not in self.breakers:
+            self.breakers[key] = CircuitBreaker(**self.breaker_options)
+        return key, self.breakers[key]
+
+    def _serve_stale(self, cache_key: str, breaker: CircuitBreaker) -> Optional[StaleResult]:
+        """Return the cached response for a read, marked stale with its age"""
+        cached = self.stale_cache.get(cache_key)
+        if cached is None:
+            return None
+        stored_at, data = cached
+        return StaleResult(data, age_seconds=breaker.clock() - stored_at)
 
     async def _request(
         self,
@@ -46,9 +216,26 @@ class PulsewayClient:
         endpoint: str,
         params: Optional[dict] = None,
         json: Optional[dict] = None,
-    ) -> dict[str, Any]:
-        """Make an authenticated request to the Pulseway API"""
+    ) -> dict[str, Any] | StaleResult:
+        """Make an authenticated request to the Pulseway API.
+
+        Requests go through a per-endpoint circuit breaker. When the API is
+        failing or the circuit is open, GET requests return a StaleResult
+        wrapping the last known good response for the same request, instead
+        of the parsed JSON. Writes, and reads with nothing cached, raise the
+        original error or CircuitOpenError.
+        """
         url = f"{self.base_url}{endpoint}"
+        breaker_key, breaker = self._breaker_for(endpoint)
+        is_read = method.upper() == "GET"
+        cache_key = f"{endpoint}?{sorted((params or {}).items())}"
+
+        permit = breaker.allow_request()
+        if permit is None:
+            stale = self._serve_stale(cache_key, breaker) if is_read else None
+            if stale is not None:
+                return stale
+            raise CircuitOpenError(breaker_key, breaker.retry_after())
 
         headers = {
             "Content-Type": "application/json",
@@ -59,17 +246,42 @@ class PulsewayClient:
             password=self.password,
         )
 
-        response = await self.client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            auth=auth,
-            params=params,
-            json=json,
-        )
-
-        response.raise_for_status()
-        return response.json()
+        started = breaker.clock()
+        try:
+            response = await self.client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                auth=auth,
+                params=params,
+                json=json,
+            )
+            response.raise_for_status()
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            # Client errors (4xx) mean the gateway is healthy and answering,
+            # except 429, which means it is rejecting us under rate limits
+            failed = not (
+                isinstance(e, httpx.HTTPStatusError)
+                and e.response.status_code < 500
+                and e.response.status_code != 429
+            )
+            breaker.record(permit, failed=failed, elapsed=breaker.clock() - started)
+            stale = self._serve_stale(cache_key, breaker) if failed and is_read else None
+            if stale is not None:
+                return stale
+            raise
+        except BaseException:
+            breaker.release(permit)
+            raise
+
+        breaker.record(permit, failed=False, elapsed=breaker.clock() - started)
+        result = response.json()
+        if is_read:
+            self.stale_cache[cache_key] = (breaker.clock(), result)
+            self.stale_cache.move_to_end(cache_key)
+            while len(self.stale_cache) > self.STALE_CACHE_SIZE:
+                self.stale_cache.popitem(last=False)
+        return result
 
     async def close(self):
         """Close the HTTP client"""
@@ -82,7 +294,7 @@ class PulsewayClient:
         assignee: Optional[str] = None,
         page: int = 1,
         page_size: int = 50,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | StaleResult:
         """List tickets with optional filters"""
         params = {"page": page, "pageSize": page_size}
         if status:
@@ -92,7 +304,7 @@ class PulsewayClient:
 
         return await self._request("GET", "/servicedesk/tickets", params=params)
 
-    async def get_ticket(self, ticket_id: int) -> dict[str, Any]:
+    async def get_ticket(self, ticket_id: int) -> dict[str, Any] | StaleResult:
         """Get details of a specific ticket"""
         return await self._request("GET", f"/servicedesk/tickets/{ticket_id}")
 
@@ -126,24 +338,24 @@ class PulsewayClient:
     # Invoice Operations
     async def list_invoices(
         self, page: int = 1, page_size: int = 50
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | StaleResult:
         """List all invoices"""
         params = {"page": page, "pageSize": page_size}
         return await self._request("GET", "/finance/invoices/summary", params=params)
 
-    async def get_invoice(self, invoice_id: int) -> dict[str, Any]:
+    async def get_invoice(self, invoice_id: int) -> dict[str, Any] | StaleResult:
         """Get details of a specific invoice"""
         return await self._request("GET", f"/finance/invoices/{invoice_id}")
 
     # Opportunity Operations
     async def list_opportunities(
         self, page: int = 1, page_size: int = 50
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | StaleResult:
         """List all opportunities"""
         params = {"page": page, "pageSize": page_size}
         return await self._request("GET", "/crm/opportunities", params=params)
 
-    async def get_opportunity(self, opportunity_id: int) -> dict[str, Any]:
+    async def get_opportunity(self, opportunity_id: int) -> dict[str, Any] | StaleResult:
         """Get details of a specific opportunity"""
         return await self._request("GET", f"/crm/opportunities/summary/{opportunity_id}")
 
@@ -169,7 +381,7 @@ class PulsewayClient:
     # Time Log Operations
     async def list_timelogs(
         self, page: int = 1, page_size: int = 50
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | StaleResult:
         """List all time logs"""
         params = {"page": page, "pageSize": page_size}
         return await self._request("GET", "/time/timelogs", params=params)
@@ -177,12 +389,12 @@ class PulsewayClient:
     # Account Operations
     async def list_accounts(
         self, page: int = 1, page_size: int = 50
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | StaleResult:
         """List all accounts"""
         params = {"page": page, "pageSize": page_size}
         return await self._request("GET", "/crm/accounts", params=params)
 
-    async def get_account(self, account_id: int) -> dict[str, Any]:
+    async def get_account(self, account_id: int) -> dict[str, Any] | StaleResult:
         """Get details of a specific account"""
         return await self._request("GET", f"/crm/accounts/{account_id}")
 
@@ -514,10 +726,18 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
         import json
+        if isinstance(result, StaleResult):
+            text = (
+                f"Warning: Pulseway API unavailable; serving stale cached data "
+                f"from {result.age_seconds:.0f}s ago.\n"
+                f"{json.dumps(result.data, indent=2)}"
+            )
+        else:
+            text = json.dumps(result, indent=2)
         return [
             TextContent(
                 type="text",
-                text=json.dumps(result, indent=2),
+                text=text,
             )
         ]
 
@@ -108,3 +108,352 @@ def test_get_client_missing_env_vars():
     with patch.dict('os.environ', {}, clear=True):
         with pytest.raises(ValueError, match="Missing required environment variables"):
             get_client()
+
+
+def test_circuit_breaker_opens_on_failure_rate_and_half_opens():
+    """Test that the breaker trips, fails fast, and closes after a good trial"""
+    from pulseway_mcp_server.server import CircuitBreaker
+
+    now = [0.0]
+    breaker = CircuitBreaker(minimum_calls=2, open_seconds=30.0, clock=lambda: now[0])
+
+    breaker.record(breaker.allow_request(), failed=True, elapsed=0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record(breaker.allow_request(), failed=True, elapsed=0.1)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is None
+
+    now[0] = 31.0
+    permit = breaker.allow_request()
+    assert permit is not None
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only one trial request at a time while half-open
+    assert breaker.allow_request() is None
+
+    breaker.record(permit, failed=False, elapsed=0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_failed_trial_reopens():
+    """Test that a failed half-open trial opens the circuit again"""
+    from pulseway_mcp_server.server import CircuitBreaker
+
+    now = [0.0]
+    breaker = CircuitBreaker(minimum_calls=1, open_seconds=30.0, clock=lambda: now[0])
+    breaker.record(breaker.allow_request(), failed=True, elapsed=0.1)
+
+    now[0] = 31.0
+    permit = breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    now[0] = 32.0
+    breaker.record(permit, failed=True, elapsed=1.0)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.opened_at == 32.0
+    assert breaker.allow_request() is None
+
+
+def test_circuit_breaker_half_open_retry_hint():
+    """Test that requests rejected during a trial are not told to retry at once"""
+    from pulseway_mcp_server.server import CircuitBreaker
+
+    now = [0.0]
+    breaker = CircuitBreaker(
+        minimum_calls=1, open_seconds=30.0, slow_call_threshold=10.0, clock=lambda: now[0]
+    )
+    breaker.record(breaker.allow_request(), failed=True, elapsed=0.1)
+
+    now[0] = 31.0
+    breaker.allow_request()
+    assert breaker.allow_request() is None
+    assert breaker.retry_after() == 10.0
+
+
+def test_circuit_breaker_forgets_old_failures():
+    """Test that failures older than the time window do not open the circuit"""
+    from pulseway_mcp_server.server import CircuitBreaker
+
+    now = [0.0]
+    breaker = CircuitBreaker(minimum_calls=3, window_seconds=300.0, clock=lambda: now[0])
+
+    for _ in range(2):
+        breaker.record(breaker.allow_request(), failed=True, elapsed=0.1)
+        now[0] += 3600.0
+    breaker.record(breaker.allow_request(), failed=True, elapsed=0.1)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert len(breaker.calls) == 1
+
+
+def test_circuit_breaker_opens_on_slow_calls():
+    """Test that slow responses trip the breaker"""
+    from pulseway_mcp_server.server import CircuitBreaker
+
+    breaker = CircuitBreaker(minimum_calls=2, slow_call_threshold=5.0)
+    breaker.record(breaker.allow_request(), failed=False, elapsed=6.0)
+    breaker.record(breaker.allow_request(), failed=False, elapsed=7.0)
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_circuit_breaker_ignores_late_results_after_opening():
+    """Test that requests in flight when the circuit opened do not re-open it"""
+    from pulseway_mcp_server.server import CircuitBreaker
+
+    now = [0.0]
+    breaker = CircuitBreaker(minimum_calls=5, open_seconds=30.0, clock=lambda: now[0])
+    permits = [breaker.allow_request() for _ in range(10)]
+
+    now[0] = 30.0
+    for permit in permits[:5]:
+        breaker.record(permit, failed=True, elapsed=30.0)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    now[0] = 35.0
+    for permit in permits[5:]:
+        breaker.record(permit, failed=True, elapsed=35.0)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.opened_at == 30.0
+    assert not breaker.calls
+
+
+def test_circuit_breaker_ignores_late_results_while_half_open():
+    """Test that only the trial request decides the half-open outcome"""
+    from pulseway_mcp_server.server import CircuitBreaker
+
+    now = [0.0]
+    breaker = CircuitBreaker(minimum_calls=1, open_seconds=30.0, clock=lambda: now[0])
+    old_success = breaker.allow_request()
+    old_failure = breaker.allow_request()
+    breaker.record(breaker.allow_request(), failed=True, elapsed=0.1)
+
+    now[0] = 31.0
+    trial = breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.record(old_success, failed=False, elapsed=31.0)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record(old_failure, failed=True, elapsed=31.0)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.release(old_success)
+    # The trial slot is still taken
+    assert breaker.allow_request() is None
+
+    breaker.record(trial, failed=False, elapsed=0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_circuit_open_serves_stale_reads_and_fails_fast():
+    """Test that an open circuit serves cached reads and rejects uncached ones"""
+    import httpx
+    from pulseway_mcp_server.server import CircuitOpenError, StaleResult
+
+    client = PulsewayClient(
+        gateway_url="https://psa.pulseway.com",
+        username="testuser",
+        password="testpass",
+        company_name="testcompany",
+        breaker_options={"minimum_calls": 1},
+    )
+    mock_response = {"tickets": [{"id": 1, "title": "Test Ticket"}]}
+
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = Mock()
+        mock_request.return_value.json.return_value = mock_response
+        await client.list_tickets()
+
+        mock_request.side_effect = httpx.ConnectTimeout("timed out")
+        result = await client.list_tickets()
+        assert isinstance(result, StaleResult)
+        assert result.data == mock_response
+
+        # The circuit is now open: reads are served without hitting the API
+        mock_request.reset_mock()
+        result = await client.list_tickets()
+        assert isinstance(result, StaleResult)
+        mock_request.assert_not_called()
+
+        with pytest.raises(CircuitOpenError):
+            await client.list_tickets(status="Open")
+        mock_request.assert_not_called()
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_result_keeps_list_payloads():
+    """Test that JSON array responses are served from cache unchanged"""
+    import httpx
+    from pulseway_mcp_server.server import StaleResult
+
+    client = PulsewayClient(
+        gateway_url="https://psa.pulseway.com",
+        username="testuser",
+        password="testpass",
+        company_name="testcompany",
+        breaker_options={"minimum_calls": 1},
+    )
+    mock_response = [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = Mock()
+        mock_request.return_value.json.return_value = mock_response
+        await client.list_accounts()
+
+        mock_request.side_effect = httpx.ConnectError("refused")
+        result = await client.list_accounts()
+        assert isinstance(result, StaleResult)
+        assert result.data == mock_response
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_trip_circuit_or_serve_stale():
+    """Test that 4xx responses are re-raised and not counted as failures"""
+    import httpx
+    from pulseway_mcp_server.server import CircuitBreaker
+
+    client = PulsewayClient(
+        gateway_url="https://psa.pulseway.com",
+        username="testuser",
+        password="testpass",
+        company_name="testcompany",
+        breaker_options={"minimum_calls": 1},
+    )
+
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = Mock()
+        mock_request.return_value.json.return_value = {"id": 1}
+        await client.get_ticket(1)
+
+        request = httpx.Request("GET", "https://psa.pulseway.com/api/v2/servicedesk/tickets/1")
+        error_response = httpx.Response(404, request=request)
+        mock_request.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Not Found", request=request, response=error_response
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_ticket(1)
+
+    _, breaker = client._breaker_for("/servicedesk/tickets/1")
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_trips_circuit_and_serves_stale():
+    """Test that 429 responses count as failures and fall back to cached reads"""
+    import httpx
+    from pulseway_mcp_server.server import CircuitBreaker, StaleResult
+
+    client = PulsewayClient(
+        gateway_url="https://psa.pulseway.com",
+        username="testuser",
+        password="testpass",
+        company_name="testcompany",
+        breaker_options={"minimum_calls": 1},
+    )
+
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = Mock()
+        mock_request.return_value.json.return_value = {"id": 1}
+        await client.get_ticket(1)
+
+        request = httpx.Request("GET", "https://psa.pulseway.com/api/v2/servicedesk/tickets/1")
+        error_response = httpx.Response(429, request=request)
+        mock_request.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Too Many Requests", request=request, response=error_response
+        )
+
+        result = await client.get_ticket(1)
+        assert isinstance(result, StaleResult)
+        assert result.data == {"id": 1}
+
+    _, breaker = client._breaker_for("/servicedesk/tickets/1")
+    assert breaker.state == CircuitBreaker.OPEN
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_never_served_stale():
+    """Test that writes raise instead of returning cached data"""
+    import httpx
+    from pulseway_mcp_server.server import CircuitOpenError, StaleResult
+
+    client = PulsewayClient(
+        gateway_url="https://psa.pulseway.com",
+        username="testuser",
+        password="testpass",
+        company_name="testcompany",
+        breaker_options={"minimum_calls": 1},
+    )
+
+    with patch.object(client.client, 'request', new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = Mock()
+        mock_request.return_value.json.return_value = {"id": 1, "status": "Open"}
+        await client.get_ticket(1)
+
+        # A cached read of the same resource is never used for a write
+        mock_request.side_effect = httpx.ConnectTimeout("timed out")
+        with pytest.raises(httpx.ConnectTimeout):
+            await client.update_ticket(1, {"status": "Closed"})
+
+        # Reads and writes share the route's breaker, which is now open
+        mock_request.reset_mock()
+        with pytest.raises(CircuitOpenError):
+            await client.update_ticket(1, {"status": "Closed"})
+        assert isinstance(await client.get_ticket(1), StaleResult)
+
+        mock_request.side_effect = httpx.ConnectTimeout("timed out")
+        with pytest.raises(httpx.ConnectTimeout):
+            await client.list_tickets()
+        with pytest.raises(CircuitOpenError):
+            await client.create_ticket(
+                title="New Ticket", description="Test description", account_id=456
+            )
+        mock_request.assert_called_once()
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_call_tool_marks_stale_results():
+    """Test that call_tool prefixes stale data with a warning"""
+    from pulseway_mcp_server.server import StaleResult, call_tool
+
+    client = Mock()
+    client.list_tickets = AsyncMock(
+        return_value=StaleResult({"tickets": []}, age_seconds=42.4)
+    )
+
+    with patch("pulseway_mcp_server.server.get_client", return_value=client):
+        result = await call_tool("list_tickets", {})
+
+    text = result[0].text
+    warning, body = text.split("\n", 1)
+    assert warning == (
+        "Warning: Pulseway API unavailable; serving stale cached data from 42s ago."
+    )
+    assert body == '{\n  "tickets": []\n}'
+
+
+@pytest.mark.asyncio
+async def test_call_tool_reports_open_circuit():
+    """Test that call_tool reports an open circuit as an error"""
+    from pulseway_mcp_server.server import CircuitOpenError, call_tool
+
+    client = Mock()
+    client.get_ticket = AsyncMock(
+        side_effect=CircuitOpenError("/servicedesk/tickets/{id}", retry_after=12.0)
+    )
+
+    with patch("pulseway_mcp_server.server.get_client", return_value=client):
+        result = await call_tool("get_ticket", {"ticket_id": 1})
+
+    assert result[0].text == (
+        "Error: Pulseway API circuit open for /servicedesk/tickets/{id}; retry in 12s"
+    )